@@ -1,14 +1,19 @@
 from __future__ import annotations
 
+import re
 from datetime import datetime
 from typing import Optional
 
 from pydantic import BaseModel, HttpUrl, ValidationInfo, field_validator
 
+# Runs of anything str.isalnum() rejects (\W plus underscore).
+_SLUG_SEPARATOR = re.compile(r"[\W_]+")
+
 
 def slugify(text: str) -> str:
-    cleaned = "".join(ch.lower() if ch.isalnum() else "-" for ch in text)
-    return "-".join(filter(None, cleaned.split("-")))[:80]
+    # Lowering the whole string turns a word-final "Σ" into "ς"; map it to
+    # "σ" first so slugs match the historical per-character lowering.
+    return _SLUG_SEPARATOR.sub("-", text).replace("Σ", "σ").lower().strip("-")[:80]
 
 
 class ArticleMetadata(BaseModel):
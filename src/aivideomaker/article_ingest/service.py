@@ -1,64 +1,183 @@
 from __future__ import annotations
 
-import io
 import json
 import logging
+import re
+import shutil
+import tempfile
+import threading
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
-from typing import Optional
+from pathlib import Path
+from typing import BinaryIO, Iterable, Literal, Optional, overload
+from urllib.parse import urlsplit, urlunsplit
 
 import requests
-from bs4 import BeautifulSoup
+from lxml import etree
+from lxml import html as lxml_html
 from pdfminer.high_level import extract_text as pdf_extract_text
 from pdfminer.pdfdocument import PDFDocument
 from pdfminer.pdfparser import PDFParser
 from pydantic import HttpUrl
+from requests.adapters import HTTPAdapter
 from trafilatura import extract as trafilatura_extract
+from urllib3.util.retry import Retry
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional faster JSON decoder
+    orjson = None  # type: ignore[assignment]
+
+try:
+    import pymupdf
+except ImportError:  # pragma: no cover - optional accelerated PDF backend
+    pymupdf = None  # type: ignore[assignment]
 
 from .model import ArticleBundle, ArticleDocument, ArticleMetadata
 
 logger = logging.getLogger(__name__)
 
+_PARAGRAPH_TEXT = etree.XPath(".//text()[not(ancestor::script) and not(ancestor::style)]")
+_LD_JSON_SCRIPTS = etree.XPath("//script[@type='application/ld+json']")
+_METADATA_NODES = etree.XPath("//title | //meta | //time")
+_PARAGRAPH_TAG = re.compile(r"<p[\s>]", re.IGNORECASE)
+_DATETIME_FORMATS = ("%Y-%m-%dT%H:%M:%S%z", "%Y-%m-%dT%H:%M:%S", "%Y-%m-%d")
+# orjson.JSONDecodeError subclasses json.JSONDecodeError, so callers catch the stdlib type.
+_json_loads = orjson.loads if orjson is not None else json.loads
+_PDF_COPY_CHUNK = 1 << 20
+_UTF8_HTML_PARSER = lxml_html.HTMLParser(encoding="utf-8")
+_TRACKING_PARAMS = frozenset({"fbclid", "gclid", "mc_cid", "mc_eid"})
+
+
+def _parse_html(html: str) -> Optional[etree._Element]:
+    """Parse the page once with lxml; every extractor reads from the same tree."""
+
+    try:
+        return lxml_html.document_fromstring(html)
+    except ValueError:
+        # lxml refuses str input carrying an XML encoding declaration; the text is already decoded.
+        try:
+            return lxml_html.document_fromstring(html.encode("utf-8"), parser=_UTF8_HTML_PARSER)
+        except (etree.ParserError, ValueError):
+            return None
+    except etree.ParserError:
+        return None
+
+
+def _cache_key(url: str) -> str:
+    """Drop tracking query params and the fragment so equivalent links share a cache entry.
+
+    Only used as a key: segments are filtered verbatim, never decoded and re-encoded, and the
+    caller's original URL is what actually gets fetched.
+    """
+
+    parts = urlsplit(url)
+    query = "&".join(
+        segment
+        for segment in parts.query.split("&")
+        if segment and not _is_tracking_param(segment.split("=", 1)[0].lower())
+    )
+    return urlunsplit((parts.scheme, parts.netloc, parts.path, query, ""))
+
+
+def _is_tracking_param(name: str) -> bool:
+    return name.startswith("utm_") or name in _TRACKING_PARAMS
+
 
 class ArticleIngestor:
     """Fetches and normalizes article content from a URL."""
 
     _MIN_WORDS = 200
+    _STUB_MAX_CHARS = 4000
+    _STUB_MAX_PARAGRAPHS = 5
 
-    def __init__(self, timeout: float = 10.0) -> None:
+    def __init__(self, timeout: float = 10.0, use_pymupdf: bool = True, cache_size: int = 128) -> None:
         self.timeout = timeout
+        # PyMuPDF is preferred when installed; disable to compare against pdfminer output.
+        self.use_pymupdf = use_pymupdf
+        self._session = self._build_session()
+        # Per-instance LRU of parsed bundles so retries and duplicate URLs skip the fetch and parse.
+        self._cache_size = cache_size
+        self._cache: OrderedDict[str, ArticleBundle] = OrderedDict()
+        self._cache_lock = threading.Lock()
 
     def ingest(self, url: str | HttpUrl) -> ArticleBundle:
-        response = requests.get(str(url), timeout=self.timeout, headers={"User-Agent": "aivideomaker/0.1"})
-        response.raise_for_status()
+        url = str(url)
+        key = _cache_key(url)
+        with self._cache_lock:
+            bundle = self._cache.get(key)
+            if bundle is not None:
+                self._cache.move_to_end(key)
+        if bundle is None:
+            bundle = self._fetch(url)
+            if self._cache_size > 0:
+                with self._cache_lock:
+                    self._cache[key] = bundle
+                    self._cache.move_to_end(key)
+                    while len(self._cache) > self._cache_size:
+                        self._cache.popitem(last=False)
+        # Hand out a copy so callers mutating a bundle don't corrupt the cached entry.
+        return bundle.model_copy(deep=True)
+
+    def cache_clear(self) -> None:
+        with self._cache_lock:
+            self._cache.clear()
+
+    def close(self) -> None:
+        """Release pooled connections held by the underlying session."""
 
-        content_type = (response.headers.get("Content-Type") or "").lower()
-        if "pdf" in content_type or str(response.url).lower().endswith(".pdf"):
-            return self._ingest_pdf(response)
+        self._session.close()
 
-        raw_html = response.text
-        extracted = trafilatura_extract(raw_html, include_comments=False, include_tables=False, url=str(url))
+    def __enter__(self) -> "ArticleIngestor":
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.close()
+
+    def _fetch(self, url: str) -> ArticleBundle:
+        # Streamed so PDFs can be spooled to disk; closing returns the connection to the pool.
+        with self._session.get(url, timeout=self.timeout, stream=True) as response:
+            response.raise_for_status()
+
+            content_type = (response.headers.get("Content-Type") or "").lower()
+            if "pdf" in content_type or str(response.url).lower().endswith(".pdf"):
+                return self._ingest_pdf(response)
+
+            raw_html = response.text
+        tree = _parse_html(raw_html)
+        extracted: Optional[str] = None
+        stub = self._looks_like_stub(raw_html)
+        if stub:
+            logger.info("Page too small to hold an article; skipping trafilatura")
+        else:
+            extracted = trafilatura_extract(raw_html, include_comments=False, include_tables=False, url=url)
         if not extracted or self._looks_sparse(extracted):
-            ld_text = self._extract_from_ld_json(raw_html)
+            ld_text = self._extract_from_ld_json(tree)
             if ld_text and not self._looks_sparse(ld_text):
                 logger.info("Using structured articleBody payload from JSON-LD")
                 extracted = ld_text
             else:
-                if extracted:
+                if stub:
+                    logger.info("Falling back to paragraph text for stub page")
+                elif extracted:
                     logger.warning(
-                        "Trafilatura extraction sparse (%d words); falling back to BeautifulSoup",
+                        "Trafilatura extraction sparse (%d words); falling back to paragraph text",
                         len(extracted.split()),
                     )
                 else:
-                    logger.warning("Trafilatura extraction failed; falling back to BeautifulSoup")
-                extracted = self._fallback_extract(raw_html)
+                    logger.warning("Trafilatura extraction failed; falling back to paragraph text")
+                extracted = self._fallback_extract(tree)
 
+        title, byline, published_at = self._extract_metadata(tree)
+        title = title or response.url
         metadata = ArticleMetadata(
-            url=str(response.url),
-            title=self._extract_title(raw_html) or response.url,
-            byline=self._extract_author(raw_html),
-            published_at=self._extract_published_at(raw_html),
+            url=response.url,
+            title=title,
+            byline=byline,
+            published_at=published_at,
             source=response.url.split("/")[2],
-            slug=None,  # type: ignore[arg-type]
+            slug=None,  # type: ignore[arg-type]  # derived once from the title by the validator
         )
         document = ArticleDocument(
             metadata=metadata,
@@ -68,18 +187,115 @@ class ArticleIngestor:
         )
         return ArticleBundle.from_document(document)
 
+    @overload
+    def ingest_many(
+        self,
+        urls: Iterable[str | HttpUrl],
+        max_workers: int = ...,
+        return_exceptions: Literal[False] = ...,
+    ) -> list[ArticleBundle]: ...
+
+    @overload
+    def ingest_many(
+        self,
+        urls: Iterable[str | HttpUrl],
+        max_workers: int = ...,
+        *,
+        return_exceptions: Literal[True],
+    ) -> list[ArticleBundle | Exception]: ...
+
+    @overload
+    def ingest_many(
+        self,
+        urls: Iterable[str | HttpUrl],
+        max_workers: int,
+        return_exceptions: Literal[True],
+    ) -> list[ArticleBundle | Exception]: ...
+
+    def ingest_many(
+        self,
+        urls: Iterable[str | HttpUrl],
+        max_workers: int = 4,
+        return_exceptions: bool = False,
+    ) -> list[ArticleBundle] | list[ArticleBundle | Exception]:
+        """Ingest several URLs concurrently, returning bundles in input order.
+
+        With ``return_exceptions`` a failed URL yields its exception in place of a
+        bundle instead of aborting the whole batch.
+        """
+
+        url_list = [str(url) for url in urls]
+        fetch = self._ingest_or_exception if return_exceptions else self.ingest
+        # The cache cannot merge fetches that are still in flight, so collapse duplicate links
+        # up front and fetch each one once, using the first original URL seen for it.
+        keys = [_cache_key(url) for url in url_list]
+        unique: dict[str, str] = {}
+        for key, url in zip(keys, url_list):
+            unique.setdefault(key, url)
+        if len(unique) <= 1:
+            results = {key: fetch(url) for key, url in unique.items()}
+        else:
+            # Fetches are network-bound, so threads sharing the pooled session overlap the waits;
+            # the session's Retry policy backs off briefly on 429/5xx.
+            workers = max(1, min(max_workers, len(unique)))
+            with ThreadPoolExecutor(max_workers=workers) as executor:
+                results = dict(zip(unique, executor.map(fetch, unique.values())))
+
+        bundles: list[ArticleBundle | Exception] = []
+        seen: set[str] = set()
+        for key in keys:
+            result = results[key]
+            if key in seen and isinstance(result, ArticleBundle):
+                result = result.model_copy(deep=True)
+            seen.add(key)
+            bundles.append(result)
+        return bundles
+
+    def _ingest_or_exception(self, url: str | HttpUrl) -> ArticleBundle | Exception:
+        try:
+            return self.ingest(url)
+        except Exception as exc:
+            logger.warning("Failed to ingest %s: %s", url, exc)
+            return exc
+
+    @staticmethod
+    def _build_session() -> requests.Session:
+        # Pooled keep-alive connections let repeated fetches skip the TCP/TLS handshake.
+        # Retry-After is ignored so a server cannot stall ingest for minutes; with the
+        # backoff below a fetch makes at most four attempts (each bounded by ``timeout``)
+        # plus under two seconds of sleeps.
+        retry = Retry(
+            total=3,
+            backoff_factor=0.3,
+            status_forcelist=(429, 500, 502, 503, 504),
+            respect_retry_after_header=False,
+            raise_on_status=False,
+        )
+        adapter = HTTPAdapter(pool_connections=10, pool_maxsize=20, max_retries=retry)
+        session = requests.Session()
+        session.headers.update({"User-Agent": "aivideomaker/0.1"})
+        session.mount("http://", adapter)
+        session.mount("https://", adapter)
+        return session
+
     def _ingest_pdf(self, response: requests.Response) -> ArticleBundle:
-        data = response.content
-        text = self._extract_pdf_text(data)
+        # Copy the body to disk in 1 MiB chunks rather than holding the whole file in memory.
+        with tempfile.TemporaryDirectory(prefix="aivideomaker-pdf-") as tmp_dir:
+            path = Path(tmp_dir) / "document.pdf"
+            response.raw.decode_content = True
+            with path.open("wb") as handle:
+                shutil.copyfileobj(response.raw, handle, _PDF_COPY_CHUNK)
+            text, title = self._read_pdf(path)
         if not text:
             logger.warning("PDF extraction produced no text for %s", response.url)
+        title = title or response.url
         metadata = ArticleMetadata(
-            url=str(response.url),
-            title=self._extract_pdf_title(data) or str(response.url),
+            url=response.url,
+            title=title,
             byline=None,
             published_at=None,
             source=response.url.split("/")[2],
-            slug=None,  # type: ignore[arg-type]
+            slug=None,  # type: ignore[arg-type]  # derived once from the title by the validator
         )
         document = ArticleDocument(
             metadata=metadata,
@@ -89,20 +305,23 @@ class ArticleIngestor:
         )
         return ArticleBundle.from_document(document)
 
-    def _fallback_extract(self, html: str) -> str:
-        soup = BeautifulSoup(html, "html.parser")
-        paragraphs = [p.get_text(strip=True) for p in soup.find_all("p")]
+    def _fallback_extract(self, tree: Optional[etree._Element]) -> str:
+        # lxml walks the paragraph text nodes in C; same output as get_text(strip=True).
+        if tree is None:
+            return ""
+        paragraphs = ("".join(text.strip() for text in _PARAGRAPH_TEXT(p)) for p in tree.iter("p"))
         return "\n".join(paragraphs)
 
-    def _extract_from_ld_json(self, html: str) -> Optional[str]:
-        soup = BeautifulSoup(html, "html.parser")
-        scripts = soup.find_all("script", type="application/ld+json")
-        for script in scripts:
-            payload = (script.string or "").strip()
-            if not payload:
+    def _extract_from_ld_json(self, tree: Optional[etree._Element]) -> Optional[str]:
+        if tree is None:
+            return None
+        for script in _LD_JSON_SCRIPTS(tree):
+            payload = (script.text or "").strip()
+            if not payload or '"articleBody"' not in payload:
+                # Breadcrumb/organization schemas never carry the body; skip decoding them.
                 continue
             try:
-                data = json.loads(payload)
+                data = _json_loads(payload)
             except json.JSONDecodeError:
                 continue
             text = self._find_article_body(data)
@@ -111,76 +330,112 @@ class ArticleIngestor:
         return None
 
     def _find_article_body(self, data: object) -> Optional[str]:
-        if isinstance(data, dict):
-            body = data.get("articleBody")
-            if isinstance(body, str) and body.strip():
-                return body
-            graph = data.get("@graph")
-            if isinstance(graph, list):
-                for item in graph:
-                    found = self._find_article_body(item)
-                    if found:
-                        return found
-        elif isinstance(data, list):
-            for item in data:
-                found = self._find_article_body(item)
-                if found:
-                    return found
+        # Depth-first over dicts, lists and @graph arrays without recursion; children are
+        # pushed in reverse so the first match in document order still wins.
+        stack: list[object] = [data]
+        while stack:
+            node = stack.pop()
+            if isinstance(node, dict):
+                body = node.get("articleBody")
+                if isinstance(body, str) and body.strip():
+                    return body
+                graph = node.get("@graph")
+                if isinstance(graph, list):
+                    stack.extend(reversed(graph))
+            elif isinstance(node, list):
+                stack.extend(reversed(node))
         return None
 
+    def _looks_like_stub(self, html: str) -> bool:
+        # Error pages, paywall and JS-required stubs are tiny; trafilatura's multi-pass
+        # scoring cannot find an article there, so go straight to the cheaper fallbacks.
+        if len(html) >= self._STUB_MAX_CHARS:
+            return False
+        return len(_PARAGRAPH_TAG.findall(html)) < self._STUB_MAX_PARAGRAPHS
+
     def _looks_sparse(self, text: str) -> bool:
         words = text.split()
         return len(words) < self._MIN_WORDS
 
-    def _extract_title(self, html: str) -> Optional[str]:
-        soup = BeautifulSoup(html, "html.parser")
-        if soup.title and soup.title.string:
-            return soup.title.string.strip()
-        og_title = soup.find("meta", property="og:title")
-        if og_title and og_title.get("content"):
-            return og_title["content"].strip()
-        return None
+    def _extract_metadata(
+        self,
+        tree: Optional[etree._Element],
+    ) -> tuple[Optional[str], Optional[str], Optional[datetime]]:
+        """Collect title, author and publish date in a single walk of the tree."""
 
-    def _extract_author(self, html: str) -> Optional[str]:
-        soup = BeautifulSoup(html, "html.parser")
-        meta_author = soup.find("meta", attrs={"name": "author"})
-        if meta_author and meta_author.get("content"):
-            return meta_author["content"].strip()
-        return None
+        if tree is None:
+            return None, None, None
+        title_text: Optional[str] = None
+        og_title: Optional[str] = None
+        author: Optional[str] = None
+        published_at: Optional[datetime] = None
+        seen_title = False
+        for node in _METADATA_NODES(tree):
+            if node.tag == "title":
+                if not seen_title:
+                    seen_title = True
+                    title_text = node.text
+            elif node.tag == "meta":
+                if og_title is None and node.get("property") == "og:title":
+                    og_title = node.get("content") or ""
+                if author is None and node.get("name") == "author":
+                    author = node.get("content") or ""
+            elif published_at is None:
+                value = node.get("datetime") or "".join(text.strip() for text in node.itertext())
+                published_at = self._parse_datetime(value)
 
-    def _extract_published_at(self, html: str) -> Optional[datetime]:
-        soup = BeautifulSoup(html, "html.parser")
-        time_tags = soup.find_all("time")
-        for tag in time_tags:
-            datetime_str = tag.get("datetime") or tag.get_text(strip=True)
-            parsed = self._parse_datetime(datetime_str)
-            if parsed:
-                return parsed
-        return None
+        title: Optional[str] = None
+        if title_text:
+            title = title_text.strip()
+        elif og_title:
+            title = og_title.strip()
+
+        return title, (author.strip() if author else None), published_at
 
     def _parse_datetime(self, value: Optional[str]) -> Optional[datetime]:
         if not value:
             return None
-        for fmt in ("%Y-%m-%dT%H:%M:%S%z", "%Y-%m-%dT%H:%M:%S", "%Y-%m-%d"):
+        try:
+            # Most <time datetime> values are ISO-8601; fromisoformat is a single C call.
+            return datetime.fromisoformat(value[:-1] + "+00:00" if value.endswith("Z") else value)
+        except ValueError:
+            pass
+        for fmt in _DATETIME_FORMATS:
             try:
                 return datetime.strptime(value, fmt)
             except ValueError:
                 continue
         return None
 
-    def _extract_pdf_text(self, data: bytes) -> str:
+    def _read_pdf(self, path: Path) -> tuple[str, Optional[str]]:
+        if self.use_pymupdf and pymupdf is not None:
+            try:
+                return self._read_pdf_pymupdf(path)
+            except Exception as exc:  # pragma: no cover - fall back to pdfminer on odd files
+                logger.warning("PyMuPDF failed to read PDF; falling back to pdfminer: %s", exc)
+        with path.open("rb") as handle:
+            text = self._extract_pdf_text(handle)
+            handle.seek(0)
+            return text, self._extract_pdf_title(handle)
+
+    def _read_pdf_pymupdf(self, path: Path) -> tuple[str, Optional[str]]:
+        # One open yields both the text and the document info dict.
+        with pymupdf.open(path, filetype="pdf") as document:
+            text = "\n".join(page.get_text() for page in document).strip()
+            title = (document.metadata or {}).get("title")
+        return text, (title.strip() or None) if isinstance(title, str) else None
+
+    def _extract_pdf_text(self, handle: BinaryIO) -> str:
         try:
-            buffer = io.BytesIO(data)
-            text = pdf_extract_text(buffer)
+            text = pdf_extract_text(handle)
             return text.strip()
         except Exception as exc:  # pragma: no cover - defensive logging for pdf parsing
             logger.error("Failed to extract text from PDF: %s", exc)
             return ""
 
-    def _extract_pdf_title(self, data: bytes) -> Optional[str]:
+    def _extract_pdf_title(self, handle: BinaryIO) -> Optional[str]:
         try:
-            buffer = io.BytesIO(data)
-            parser = PDFParser(buffer)
+            parser = PDFParser(handle)
             document = PDFDocument(parser)
             if document.info:
                 info = document.info[0]
@@ -0,0 +1,78 @@
+from __future__ import annotations
+
+import re
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import Sequence
+
+WORD_PATTERN = re.compile(r"\S+")
+
+
+@dataclass(frozen=True)
+class WordTiming:
+    text: str
+    start: float
+    end: float
+
+
+def parse_alignment(transcript: str, alignment: dict) -> list[WordTiming]:
+    """Map ElevenLabs character timings onto the transcript and group them into words."""
+
+    payload = alignment.get("alignment") or alignment
+    chars: Sequence[str] = payload.get("characters", [])
+    starts: Sequence[float] = payload.get("character_start_times_seconds", [])
+    ends: Sequence[float] = payload.get("character_end_times_seconds", [])
+    if not (chars and starts and ends) or not (len(chars) == len(starts) == len(ends)):
+        raise ValueError("Alignment payload missing character timing data")
+    # The planner and the caption builder both parse the same narration in one run; key the
+    # cache on content (not id()) so payloads reloaded from disk still hit.
+    return list(_parse_alignment_cached(transcript, tuple(chars), tuple(starts), tuple(ends)))
+
+
+@lru_cache(maxsize=4)
+def _parse_alignment_cached(
+    transcript: str,
+    chars: tuple[str, ...],
+    starts: tuple[float, ...],
+    ends: tuple[float, ...],
+) -> tuple[WordTiming, ...]:
+    # Single pass: match each transcript char to its alignment timing with an index cursor
+    # (skipping extra alignment chars until one matches exactly, as whitespace, or
+    # case-insensitively) and close a word at every whitespace char.
+    words: list[WordTiming] = []
+    word_begin = -1
+    current_start = 0.0
+    current_end = 0.0
+    index = 0
+    total = len(chars)
+    for position, ch in enumerate(transcript):
+        lowered = ch.lower()
+        is_space = ch.isspace()
+        while index < total:
+            candidate = chars[index]
+            if candidate == ch or (is_space and candidate.isspace()) or candidate.lower() == lowered:
+                break
+            index += 1
+        else:
+            raise ValueError("Alignment characters ran out before the transcript was matched")
+        start = starts[index]
+        end = ends[index]
+        index += 1
+
+        if is_space:
+            if word_begin >= 0:
+                text = transcript[word_begin:position]
+                words.append(WordTiming(text=text, start=current_start or start, end=current_end or end))
+                word_begin = -1
+            continue
+
+        if word_begin < 0:
+            word_begin = position
+            current_start = start
+        current_end = end
+
+    if word_begin >= 0:
+        text = transcript[word_begin:]
+        words.append(WordTiming(text=text, start=current_start or 0.0, end=current_end or current_start or 0.0))
+
+    return tuple(words)
@@ -2,24 +2,34 @@ from __future__ import annotations
 
 import logging
 import re
-from dataclasses import dataclass
-from typing import Iterable, Iterator, List, Sequence
+from bisect import bisect_left
+from typing import Iterable, List
 
 from aivideomaker.script_engine.model import ScriptPlan
 
+from .alignment import WORD_PATTERN, WordTiming, parse_alignment
 from .model import Chunk, ChunkPlan
 
 logger = logging.getLogger(__name__)
 
-WORD_PATTERN = re.compile(r"\S+")
+PUNCT_SPACE_PATTERN = re.compile(r"\s+([.,!?;:])")
+PARAGRAPH_BREAK_PATTERN = re.compile(r"\n\s*\n")
+# Sentence ends, except inside dotted abbreviations ("U.S.", "e.g."), runs of initials
+# ("J. K. Rowling", "J. P. Morgan") and common titles. A lone capital letter only counts as
+# an initial next to another one, so "not even I. Then" and "option B. It" still split.
+SENTENCE_BOUNDARY_PATTERN = re.compile(
+    r"(?<=[.!?])"
+    r"(?<!\b[A-Z]\.[A-Z]\.)(?<!\b[a-z]\.[a-z]\.)"
+    r"(?<!\b[A-Z]\.\s[A-Z]\.)(?!(?<=\b[A-Z]\.)\s+[A-Z]\.)"
+    r"(?<!\bMr\.)(?<!\bMs\.)(?<!\bDr\.)(?<!\bSt\.)(?<!\bJr\.)(?<!\bSr\.)(?<!\bvs\.)"
+    r"(?<!\bMrs\.)(?<!\bProf\.)"
+    r"\s+"
+)
+# Progressively finer cut points for sentences that are too long to narrate in one clip.
+SUBSENTENCE_SEPARATORS = (re.compile(r"(?<=[,;:])\s+"), re.compile(r"\s+"))
 ALLOWED_DURATIONS = (4, 8, 12)
-
-
-@dataclass
-class WordTiming:
-    text: str
-    start: float
-    end: float
+WORDS_PER_SECOND = 2.5
+MAX_WORDS_PER_CHUNK = int(ALLOWED_DURATIONS[-1] * WORDS_PER_SECOND)
 
 
 class ChunkPlanner:
@@ -36,108 +46,41 @@ class ChunkPlanner:
     # Alignment-aware planning -------------------------------------------------
 
     def _plan_with_alignment(self, script: ScriptPlan, alignment: dict) -> ChunkPlan:
-        words = self._parse_alignment(script.full_transcript, alignment)
-        word_iter = iter(words)
+        words = parse_alignment(script.full_transcript, alignment)
+        total_words = len(words)
+        cursor = 0
         chunks: list[Chunk] = []
 
         for beat in script.beats:
-            beat_words = list(self._consume_words_for_text(word_iter, beat.transcript))
-            if not beat_words:
+            # Index into the global word list instead of materializing each beat's words;
+            # only beats that must be split get a slice.
+            expected = len(WORD_PATTERN.findall(beat.transcript))
+            end = min(cursor + expected, total_words)
+            if end - cursor < expected:
+                logger.warning("Ran out of alignment words while mapping beat text")
+            if end == cursor:
                 continue
-            duration = beat_words[-1].end - beat_words[0].start
+            first_word = words[cursor]
+            last_word = words[end - 1]
+            duration = last_word.end - first_word.start
             if duration <= ALLOWED_DURATIONS[-1]:
-                chunk_id = beat.id
-                text = beat.transcript.strip()
-                target_duration = self._select_duration(duration)
                 chunks.append(
                     Chunk(
-                        id=chunk_id,
+                        id=beat.id,
                         beat_id=beat.id,
-                        transcript=text,
-                        estimated_duration_sec=float(target_duration),
-                        start_time_sec=float(beat_words[0].start),
-                        end_time_sec=float(beat_words[-1].end),
+                        transcript=beat.transcript.strip(),
+                        estimated_duration_sec=float(self._select_duration(duration)),
+                        start_time_sec=float(first_word.start),
+                        end_time_sec=float(last_word.end),
                     )
                 )
-                continue
-            segments = self._segment_beat_words(beat.id, beat.transcript, beat_words)
-            chunks.extend(segments)
+            else:
+                chunks.extend(self._segment_beat_words(beat.id, beat.transcript, words[cursor:end]))
+            cursor = end
 
         total = sum(chunk.estimated_duration_sec for chunk in chunks)
         return ChunkPlan(chunks=chunks, total_duration_sec=total)
 
-    def _parse_alignment(self, transcript: str, alignment: dict) -> list[WordTiming]:
-        payload = alignment.get("alignment") or alignment
-        chars: Sequence[str] = payload.get("characters", [])
-        starts: Sequence[float] = payload.get("character_start_times_seconds", [])
-        ends: Sequence[float] = payload.get("character_end_times_seconds", [])
-        if not (chars and starts and ends) or not (len(chars) == len(starts) == len(ends)):
-            raise ValueError("Alignment payload missing character timing data")
-
-        mapped: list[tuple[str, float, float]] = []
-        align_iter: Iterator[tuple[str, float, float]] = iter(zip(chars, starts, ends))
-
-        for char in transcript:
-            mapped_char, start, end = self._next_matching_char(char, align_iter)
-            mapped.append((mapped_char, start, end))
-
-        words: list[WordTiming] = []
-        current_chars: list[str] = []
-        current_start: float | None = None
-        current_end: float | None = None
-
-        for char, start, end in mapped:
-            if char.isspace():
-                if current_chars:
-                    text = "".join(current_chars)
-                    words.append(WordTiming(text=text, start=current_start or start, end=current_end or end))
-                    current_chars = []
-                    current_start = None
-                    current_end = None
-                continue
-
-            if current_start is None:
-                current_start = start
-            current_chars.append(char)
-            current_end = end
-
-        if current_chars:
-            text = "".join(current_chars)
-            words.append(WordTiming(text=text, start=current_start or 0.0, end=current_end or current_start or 0.0))
-
-        return words
-
-    def _next_matching_char(
-        self,
-        target: str,
-        align_iter: Iterator[tuple[str, float, float]],
-    ) -> tuple[str, float, float]:
-        """Advance through alignment chars until we find a match for the transcript char."""
-
-        lowered_target = target.lower()
-        while True:
-            mapped_char, start, end = next(align_iter)
-            if mapped_char == target:
-                return mapped_char, start, end
-            if mapped_char.isspace() and target.isspace():
-                return target, start, end
-            if mapped_char.lower() == lowered_target:
-                return target, start, end
-            # Otherwise skip extra alignment char and continue.
-
-    def _consume_words_for_text(
-        self,
-        word_iter: Iterator[WordTiming],
-        text: str,
-    ) -> Iterator[WordTiming]:
-        expected_words = WORD_PATTERN.findall(text)
-        for _ in expected_words:
-            try:
-                yield next(word_iter)
-            except StopIteration:
-                logger.warning("Ran out of alignment words while mapping beat text")
-                return
-
     def _segment_beat_words(
         self,
         beat_id: str,
@@ -201,7 +144,7 @@ class ChunkPlanner:
 
     def _compose_segment_text(self, words: list[WordTiming]) -> str:
         text = " ".join(w.text for w in words)
-        text = re.sub(r"\s+([.,!?;:])", r"\1", text)
+        text = PUNCT_SPACE_PATTERN.sub(r"\1", text)
         return text.strip()
 
     # Heuristic fallback -------------------------------------------------------
@@ -212,7 +155,7 @@ class ChunkPlanner:
             transcripts = self._split_transcript(beat.transcript)
             for index, segment in enumerate(transcripts, start=1):
                 chunk_id = beat.id if len(transcripts) == 1 else f"{beat.id}-{index}"
-                duration = len(segment.split()) / 2.5
+                duration = len(segment.split()) / WORDS_PER_SECOND
                 duration = float(self._select_duration(duration))
                 chunks.append(
                     Chunk(
@@ -228,8 +171,40 @@ class ChunkPlanner:
         return ChunkPlan(chunks=chunks, total_duration_sec=total)
 
     def _split_transcript(self, transcript: str) -> list[str]:
-        sentences = re.split(r"(?<=[.!?])\s+", transcript.strip())
-        return [sentence for sentence in sentences if sentence]
+        # Paragraphs and sentences always start a new segment; only a sentence longer than one
+        # clip's narration budget is cut further, at clause and then word boundaries.
+        segments: list[str] = []
+        for paragraph in PARAGRAPH_BREAK_PATTERN.split(transcript.strip()):
+            for sentence in SENTENCE_BOUNDARY_PATTERN.split(paragraph.strip()):
+                if sentence:
+                    segments.extend(self._fit_word_budget(sentence, 0))
+        return segments
+
+    def _fit_word_budget(self, text: str, level: int) -> list[str]:
+        if level >= len(SUBSENTENCE_SEPARATORS) or len(text.split()) <= MAX_WORDS_PER_CHUNK:
+            return [text]
+
+        segments: list[str] = []
+        current: list[str] = []
+        current_words = 0
+        for piece in SUBSENTENCE_SEPARATORS[level].split(text):
+            if not piece:
+                continue
+            piece_words = len(piece.split())
+            if piece_words > MAX_WORDS_PER_CHUNK:
+                if current:
+                    segments.append(" ".join(current))
+                    current, current_words = [], 0
+                segments.extend(self._fit_word_budget(piece, level + 1))
+                continue
+            if current and current_words + piece_words > MAX_WORDS_PER_CHUNK:
+                segments.append(" ".join(current))
+                current, current_words = [], 0
+            current.append(piece)
+            current_words += piece_words
+        if current:
+            segments.append(" ".join(current))
+        return segments
 
     @staticmethod
     def batch(chunks: Iterable[Chunk], batch_duration: float = ALLOWED_DURATIONS[-1]) -> list[list[Chunk]]:
@@ -249,8 +224,7 @@ class ChunkPlanner:
 
     @staticmethod
     def _select_duration(seconds: float) -> int:
-        seconds = max(seconds, ALLOWED_DURATIONS[0])
-        for candidate in ALLOWED_DURATIONS:
-            if seconds <= candidate:
-                return candidate
-        return ALLOWED_DURATIONS[-1]
+        # Written as "not <=" so NaN also lands on the longest clip.
+        if not seconds <= ALLOWED_DURATIONS[-1]:
+            return ALLOWED_DURATIONS[-1]
+        return ALLOWED_DURATIONS[bisect_left(ALLOWED_DURATIONS, seconds)]
@@ -8,8 +8,6 @@ from pathlib import Path
 
 from dotenv import load_dotenv
 
-from .orchestrator import PipelineBundle, PipelineOrchestrator, ScriptRejectedError
-
 
 def build_parser() -> argparse.ArgumentParser:
     parser = argparse.ArgumentParser(
@@ -66,6 +64,9 @@ def main() -> None:
     parser = build_parser()
     args = parser.parse_args()
 
+    # Imported after argument parsing so `--help` and usage errors skip the heavy media/LLM stack.
+    from .orchestrator import PipelineBundle, PipelineOrchestrator, ScriptRejectedError
+
     orchestrator = (
         PipelineOrchestrator.from_file(args.config)
         if args.config
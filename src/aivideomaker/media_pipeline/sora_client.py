@@ -2,6 +2,7 @@ from __future__ import annotations
 
 import json
 import logging
+import shutil
 import time
 from pathlib import Path
 from typing import Callable, Iterable, Mapping
@@ -15,6 +16,7 @@ from aivideomaker.prompt_builder.model import MediaPrompt
 logger = logging.getLogger(__name__)
 
 ProgressCallback = Callable[[str, MediaPrompt, int, int, str], None]
+_DOWNLOAD_CHUNK_SIZE = 1 << 20
 
 
 class SoraJobError(RuntimeError):
@@ -275,6 +277,9 @@ class SoraClient:
         start = time.monotonic()
         status_payload: dict | None = None
         last_status: str | None = None
+        previous_status: str | None = None
+        # Poll quickly at first and back off towards poll_interval; restart on status changes.
+        delay = min(1.0, self.poll_interval)
         while True:
             if time.monotonic() - start > self.max_wait:
                 raise TimeoutError(f"Sora job {job_id} timed out after {self.max_wait} seconds")
@@ -292,6 +297,9 @@ class SoraClient:
                 time.sleep(self.poll_interval)
                 continue
             status = status_payload.get("status")
+            if status != previous_status:
+                delay = min(1.0, self.poll_interval)
+                previous_status = status
             if (
                 prompt is not None
                 and index > 0
@@ -315,21 +323,23 @@ class SoraClient:
             if status == "failed":
                 error_message = status_payload.get("error") or status_payload
                 raise SoraJobError(f"Sora job {job_id} failed: {error_message}")
-            time.sleep(self.poll_interval)
+            time.sleep(delay * random.uniform(0.75, 1.0))
+            delay = min(self.poll_interval, delay * 2)
 
     def _download_video(self, job_id: str, target: Path) -> None:
-        response = requests.get(
+        with requests.get(
             f"{self.base_url}/videos/{job_id}/content",
             headers={"Authorization": f"Bearer {self.api_key}"},
             stream=True,
             timeout=self.request_timeout,
             params={"variant": "video"},
-        )
-        response.raise_for_status()
-        self._respect_rate_limits(response.headers)
-        with target.open("wb") as handle:
-            for chunk in response.iter_content(chunk_size=8192):
-                handle.write(chunk)
+        ) as response:
+            response.raise_for_status()
+            self._respect_rate_limits(response.headers)
+            # Bulk-copy the body in 1 MiB reads; decode_content keeps gzip/deflate transparent.
+            response.raw.decode_content = True
+            with target.open("wb") as handle:
+                shutil.copyfileobj(response.raw, handle, _DOWNLOAD_CHUNK_SIZE)
         logger.info("Saved Sora video to %s", target)
 
     def _respect_submit_cooldown(self) -> None:
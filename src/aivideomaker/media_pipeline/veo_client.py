@@ -215,10 +215,13 @@ class VeoClient:
 
         start = time.monotonic()
         current = operation
+        # Poll quickly at first and back off towards poll_interval.
+        delay = min(1.0, self.poll_interval)
         while not current.done:
             if time.monotonic() - start > self.max_wait:
                 raise TimeoutError(f"Veo operation {current.name} timed out after {self.max_wait} seconds")
-            time.sleep(self.poll_interval)
+            time.sleep(delay * random.uniform(0.75, 1.0))
+            delay = min(self.poll_interval, delay * 2)
             current = self.client.operations.get(operation=current)
 
         if current.error is not None: